@@ -1,19 +1,19 @@
 """API routes module"""
-from hashlib import sha256
-from datetime import datetime
-from fastapi import FastAPI, HTTPException, status, Depends
+from fastapi import FastAPI, HTTPException, status, Depends, Response
+from fastapi.responses import ORJSONResponse
 from app.schemas.string import StringRequest, \
                                 StringResponse, \
-                                StringProperties, \
                                 StringFilters, \
                                 StringListResponse, \
                                 NaturalLanguageFilterResponse
-from app.storage import strings_db
+from app.storage import strings_db, strings_json, add_string, remove_string
+from app.utils.clock import now_cached
 from app.utils.filter_strings import filter_strings
 from app.utils.natural_language_parser import parse_natural_language_query
+from app.utils.string_properties import compute_string_properties
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 @app.get("/")
@@ -36,49 +36,27 @@ def get_all_strings(filters: StringFilters = Depends()):
 
     Returns
     -------
-    A list of all strings that exist (in-memory)
+    A page of at most `limit` strings that exist (in-memory), starting at
+    `offset`. `count` is the total number of matching strings.
 
     Raises
     ------
-    HTTPException - if no strings exist or if the query parameters are invalid
+    HTTPException - if no strings exist or none match the filters (invalid
+    query parameters are rejected with 422 by the StringFilters schema)
     """
 
-    try:
-        if filters.contains_character and len(
-                filters.contains_character) > 1:
-            raise ValueError("contains_character must be a single character.")
-        if filters.min_length is not None and filters.min_length < 0:
-            raise ValueError("min_length must be a positive integer.")
-        if filters.max_length is not None and filters.max_length < 0:
-            raise ValueError("max_length must be a positive integer.")
-        if filters.word_count is not None and filters.word_count < 0:
-            raise ValueError("word_count must be a positive integer.")
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid query parameter values or types: {str(e)}"
-        ) from e
-
-    filters_dict = {
-        "is_palindrome": filters.is_palindrome,
-        "min_length": filters.min_length,
-        "max_length": filters.max_length,
-        "word_count": filters.word_count,
-        "contains_character": filters.contains_character
-    }
+    result = filter_strings(filters.model_dump(exclude={"limit", "offset"}))
 
-    if not strings_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No strings found."
-        )
-
-    try:
-        result = filter_strings(filters_dict)
-    except HTTPException as e:
-        raise e
-
-    return result
+    page = result["data"][filters.offset:filters.offset + filters.limit]
+    # Skip strings deleted since the lookup rather than failing the request.
+    items = [item for item in (strings_json.get(x.value) for x in page)
+             if item is not None]
+    # Stitch the envelope together from the pre-serialized responses instead
+    # of validating and encoding every stored string again.
+    content = (b'{"data":[' + b",".join(items) + b'],"count":'
+               + str(result["count"]).encode() + b',"filters_applied":'
+               + filters.model_dump_json().encode() + b"}")
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/strings/filter-by-natural-language",
@@ -113,8 +91,6 @@ def filter_by_natural_language(query: str):
         )
     try:
         filters = parse_natural_language_query(query)
-        print("filters", filters)
-
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -148,12 +124,15 @@ def get_string(string_value: str):
     ------
     HTTPException - if the string does not exist
     """
-    if string_value not in strings_db:
+    # A single lookup, so a concurrent delete cannot slip in between a
+    # membership check and the read.
+    content = strings_json.get(string_value)
+    if content is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="String not found."
         )
-    return strings_db[string_value]
+    return Response(content=content, media_type="application/json")
 
 
 @app.post("/strings", response_model=StringResponse,
@@ -177,36 +156,26 @@ def analyze_string(request: StringRequest):
 
     value = request.value
 
-    if value is None or value.strip() == "" or not isinstance(value, str):
+    if not value or value.isspace():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="String value is required."
         )
 
-    if value in strings_db:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="String already exists. Please enter a different string."
-        )
+    properties = compute_string_properties(value)
 
-    properties = StringProperties(
-        length=len(value),
-        is_palindrome=value.lower() == value.lower()[::-1],
-        unique_characters=len(set(value)),
-        word_count=len(value.split()),
-        sha256_hash=sha256(value.encode()).hexdigest(),
-        character_frequency_map={char: value.count(char)
-                                 for char in set(value)}
-    )
-
-    response = StringResponse(
+    response = StringResponse.model_construct(
         id=properties.sha256_hash,
         value=value,
         properties=properties,
-        created_at=datetime.now()
+        created_at=now_cached()
     )
 
-    strings_db[value] = response
+    if not add_string(response):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="String already exists. Please enter a different string."
+        )
     return response
 
 
@@ -227,9 +196,8 @@ def delete_string(string_value: str):
     ------
     HTTPException - if the string does not exist
     """
-    if string_value not in strings_db:
+    if not remove_string(string_value):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="String not found."
         )
-    del strings_db[string_value]
@@ -1,5 +1,5 @@
 """String schema module"""
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -18,11 +18,15 @@ class StringFilters(BaseModel):
     """
     Filters for string requests
     """
+    model_config = ConfigDict(frozen=True)
+
     is_palindrome: Optional[bool] = None
-    min_length: Optional[int] = None
-    max_length: Optional[int] = None
-    word_count: Optional[int] = None
-    contains_character: Optional[str] = None
+    min_length: Optional[int] = Field(None, ge=0)
+    max_length: Optional[int] = Field(None, ge=0)
+    word_count: Optional[int] = Field(None, ge=0)
+    contains_character: Optional[str] = Field(None, min_length=1, max_length=1)
+    limit: int = Field(100, ge=0, le=1000)
+    offset: int = Field(0, ge=0)
 
 
 class StringRequest(BaseModel):
@@ -1,3 +1,222 @@
 """Simple in-memory storage for strings"""
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+from itertools import count
+from threading import Lock
 
 strings_db = {}
+
+# Guards strings_db and every index below. Handlers run on a threadpool, so
+# writers hold it for a whole add/remove and readers hold it while they look
+# up the indexes, which keeps readers from seeing a half-applied update.
+lock = Lock()
+
+# JSON encoding of each stored response, serialized once at insert time so
+# reads can write the bytes out directly.
+strings_json = {}
+
+# Secondary indexes mapping a property value to the set of stored strings
+# that have it, so filters can be answered without scanning strings_db.
+by_palindrome = {True: set(), False: set()}
+by_length = {}
+by_word_count = {}
+by_char = {}
+
+# Distinct lengths in ascending order, used for min/max length range queries.
+sorted_lengths = []
+
+# Insertion sequence number of each stored string, used to return filter
+# results in the same order as strings_db.
+insertion_order = {}
+_sequence = count()
+
+
+def add_string(response):
+    """
+    Store an analyzed string and add it to every index.
+
+    Parameters
+    ----------
+    response : StringResponse
+        The analyzed string to store.
+
+    Returns
+    -------
+    bool
+        False if the string is already stored (e.g. a concurrent request
+        added it first), True otherwise.
+    """
+    value = response.value
+    properties = response.properties
+    encoded = response.model_dump_json().encode()
+
+    with lock:
+        if value in strings_db:
+            return False
+        # Publish the JSON before the response, so any string visible in
+        # strings_db always has its encoding available.
+        strings_json[value] = encoded
+        strings_db[value] = response
+        insertion_order[value] = next(_sequence)
+
+        by_palindrome[properties.is_palindrome].add(value)
+
+        if properties.length not in by_length:
+            by_length[properties.length] = set()
+            insort(sorted_lengths, properties.length)
+        by_length[properties.length].add(value)
+
+        by_word_count.setdefault(properties.word_count, set()).add(value)
+
+        for char in properties.character_frequency_map:
+            by_char.setdefault(char, set()).add(value)
+
+        _find_strings_cached.cache_clear()
+    return True
+
+
+def remove_string(value: str):
+    """
+    Remove a stored string and drop it from every index.
+
+    Parameters
+    ----------
+    value : str
+        The string to remove.
+
+    Returns
+    -------
+    bool
+        False if the string was not stored (e.g. a concurrent request
+        already removed it), True otherwise.
+    """
+    with lock:
+        if value not in strings_db:
+            return False
+        properties = strings_db.pop(value).properties
+        del strings_json[value]
+        del insertion_order[value]
+
+        by_palindrome[properties.is_palindrome].discard(value)
+
+        _discard_from(by_length, properties.length, value)
+        if properties.length not in by_length:
+            del sorted_lengths[bisect_left(sorted_lengths, properties.length)]
+
+        _discard_from(by_word_count, properties.word_count, value)
+
+        for char in properties.character_frequency_map:
+            _discard_from(by_char, char, value)
+
+        _find_strings_cached.cache_clear()
+    return True
+
+
+def find_strings(active_filters: frozenset) -> tuple:
+    """
+    Get the stored strings matching a set of filters.
+
+    Parameters
+    ----------
+    active_filters : frozenset
+        (name, value) pairs of the filters that are set, e.g.
+        frozenset({("is_palindrome", True), ("min_length", 5)}).
+
+    Returns
+    -------
+    tuple
+        The matching StringResponse objects, in insertion order.
+    """
+    # The cache is filled and cleared under the lock, so a result computed
+    # before a mutation can never be stored after that mutation cleared it.
+    with lock:
+        return _find_strings_cached(active_filters)
+
+
+def _strings_with_length(min_length=None, max_length=None) -> set:
+    """
+    Get the stored strings whose length lies within the given bounds.
+
+    Callers must hold the lock.
+
+    Parameters
+    ----------
+    min_length : int, optional
+        Inclusive lower bound on the length.
+    max_length : int, optional
+        Inclusive upper bound on the length.
+
+    Returns
+    -------
+    set
+        The matching string values.
+    """
+    start = 0 if min_length is None else bisect_left(sorted_lengths,
+                                                     min_length)
+    end = len(sorted_lengths) if max_length is None else bisect_right(
+        sorted_lengths, max_length)
+    return set().union(*(by_length[length]
+                         for length in sorted_lengths[start:end]))
+
+
+def _discard_from(index: dict, key, value: str):
+    """Remove a value from an index bucket, dropping the bucket if empty."""
+    bucket = index[key]
+    bucket.discard(value)
+    if not bucket:
+        del index[key]
+
+
+@lru_cache(maxsize=512)
+def _find_strings_cached(active_filters: frozenset) -> tuple:
+    """
+    Look up the strings matching a set of filters in the indexes.
+
+    Results are cached until the next add_string/remove_string clears the
+    cache. Callers must hold the lock.
+
+    Parameters
+    ----------
+    active_filters : frozenset
+        (name, value) pairs of the filters that are set.
+
+    Returns
+    -------
+    tuple
+        The matching StringResponse objects, in insertion order.
+    """
+    filters = dict(active_filters)
+    min_length = filters.get("min_length")
+    max_length = filters.get("max_length")
+    candidates = []
+
+    if filters.get("is_palindrome") is not None:
+        candidates.append(by_palindrome[filters["is_palindrome"]])
+
+    if filters.get("word_count") is not None:
+        candidates.append(by_word_count.get(filters["word_count"], set()))
+
+    if filters.get("contains_character"):
+        candidates.append(by_char.get(filters["contains_character"], set()))
+
+    if not candidates:
+        if min_length is None and max_length is None:
+            return tuple(strings_db.values())
+        matches = _strings_with_length(min_length, max_length)
+    else:
+        # Start from the most selective index so every intersection step
+        # (and the length check below) only walks the smallest working set.
+        candidates.sort(key=len)
+        matches = candidates[0].intersection(*candidates[1:])
+        if min_length is not None or max_length is not None:
+            matches = {x for x in matches
+                       if _length_in_range(strings_db[x].properties.length,
+                                           min_length, max_length)}
+
+    return tuple(strings_db[x] for x in sorted(matches, key=insertion_order.get))
+
+
+def _length_in_range(length: int, min_length, max_length) -> bool:
+    """Check a length against optional inclusive bounds."""
+    return ((min_length is None or length >= min_length)
+            and (max_length is None or length <= max_length))
@@ -0,0 +1,33 @@
+"""
+Utility function for reading the current time.
+"""
+from datetime import datetime
+from time import monotonic_ns
+
+# How long a sampled wall-clock time is reused for (1 millisecond).
+_RESOLUTION_NS = 1_000_000
+
+# One-element list holding the last (monotonic_ns, datetime) sample. The
+# sample is swapped with a single item assignment, so threads always read a
+# consistent pair.
+_now_cache = [(monotonic_ns(), datetime.now())]
+
+
+def now_cached() -> datetime:
+    """
+    Get the current local time at millisecond granularity.
+
+    The wall clock is sampled at most once per millisecond; requests that
+    arrive within the same millisecond share the same datetime object.
+
+    Returns
+    -------
+    datetime
+        The (cached) current time.
+    """
+    sampled_at, now = _now_cache[0]
+    current = monotonic_ns()
+    if current - sampled_at > _RESOLUTION_NS:
+        now = datetime.now()
+        _now_cache[0] = (current, now)
+    return now
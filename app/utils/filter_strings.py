@@ -3,7 +3,7 @@ Utility functions for filtering strings.
 """
 
 from fastapi import HTTPException, status
-from app.storage import strings_db
+from app.storage import strings_db, find_strings
 
 
 def filter_strings(filters: dict):
@@ -31,22 +31,9 @@ def filter_strings(filters: dict):
             detail="No strings found."
         )
 
-    results = list(strings_db.values())
-
-    if filters.get("is_palindrome") is not None:
-        results = [x for x in results if x.properties.is_palindrome == filters["is_palindrome"]]
-
-    if filters.get("min_length") is not None:
-        results = [x for x in results if x.properties.length >= filters["min_length"]]
-
-    if filters.get("max_length") is not None:
-        results = [x for x in results if x.properties.length <= filters["max_length"]]
-
-    if filters.get("word_count") is not None:
-        results = [x for x in results if x.properties.word_count == filters["word_count"]]
-
-    if filters.get("contains_character"):
-        results = [x for x in results if filters["contains_character"] in x.value]
+    active_filters = frozenset((key, value) for key, value in filters.items()
+                               if value is not None)
+    results = find_strings(active_filters)
 
     if not results:
         raise HTTPException(
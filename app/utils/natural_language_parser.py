@@ -3,6 +3,20 @@ Utility function for parsing natural language
 """
 import re
 
+# One alternation over every supported phrase, so a query is parsed in a
+# single scan. The contained character is captured with a lookahead so it is
+# not consumed (e.g. "containing palindromes" still matches "palindrome").
+_QUERY_PATTERN = re.compile(
+    r"(single word)"
+    r"|longer than (\d+)"
+    r"|shorter than (\d+)"
+    r"|containing (?:the letter )?(?=([a-z]))"
+    r"|(palindrom(?:e|ic))"
+)
+
+_SINGLE_WORD, _LONGER_THAN, _SHORTER_THAN, _CONTAINING, _PALINDROME = range(1, 6)
+
+
 def parse_natural_language_query(query: str):
     """
     Parse a natural language query into structured filters.
@@ -17,23 +31,19 @@ def parse_natural_language_query(query: str):
     filters = {}
 
     try:
-        if "single word" in query:
-            filters["word_count"] = 1
-
-        match = re.search(r"longer than (\d+)", query)
-        if match:
-            filters["min_length"] = int(match.group(1))
-
-        match = re.search(r"shorter than (\d+)", query)
-        if match:
-            filters["max_length"] = int(match.group(1))
-
-        match = re.search(r"containing (?:the letter )?([a-z])", query)
-        if match:
-            filters["contains_character"] = match.group(1)
-
-        if "palindromic" in query or "palindrome" in query:
-            filters["is_palindrome"] = True
+        for match in _QUERY_PATTERN.finditer(query):
+            group = match.lastindex
+            # setdefault keeps the first occurrence of each phrase
+            if group == _SINGLE_WORD:
+                filters.setdefault("word_count", 1)
+            elif group == _LONGER_THAN:
+                filters.setdefault("min_length", int(match.group(group)))
+            elif group == _SHORTER_THAN:
+                filters.setdefault("max_length", int(match.group(group)))
+            elif group == _CONTAINING:
+                filters.setdefault("contains_character", match.group(group))
+            elif group == _PALINDROME:
+                filters.setdefault("is_palindrome", True)
 
     except Exception:
         raise ValueError(f"Unsupported or invalid query format: '{query}'")
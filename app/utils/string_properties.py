@@ -0,0 +1,47 @@
+"""
+Utility function for computing string properties.
+"""
+from collections import Counter
+from hashlib import sha256
+from app.schemas.string import StringProperties
+
+
+def _is_palindrome(value: str) -> bool:
+    """
+    Check whether a string reads the same backwards (case-insensitive).
+
+    The string is lowercased once and only its first half is compared with
+    the reversed second half, so the full reversed copy is never built.
+    """
+    lowered = value.lower()
+    half = len(lowered) // 2
+    return lowered[:half] == lowered[:-half - 1:-1]
+
+
+def compute_string_properties(value: str) -> StringProperties:
+    """
+    Compute all analyzed properties of a string.
+
+    Intermediate results (such as the character counts) are computed once
+    and shared between properties instead of rescanning the string.
+
+    Parameters
+    ----------
+    value : str
+        The string to analyze.
+
+    Returns
+    -------
+    StringProperties
+        The properties of the string.
+    """
+    char_counts = Counter(value)
+
+    return StringProperties.model_construct(
+        length=len(value),
+        is_palindrome=_is_palindrome(value),
+        unique_characters=len(char_counts),
+        word_count=len(value.split()),
+        sha256_hash=sha256(value.encode()).hexdigest(),
+        character_frequency_map=dict(char_counts)
+    )